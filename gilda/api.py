@@ -113,6 +113,7 @@ def annotate(
     organisms=None,
     namespaces=None,
     context_text: str = None,
+    n_jobs: int = 1,
 ) -> List[Annotation]:
     """Annotate a given text with Gilda (i.e., do named entity recognition).
 
@@ -135,6 +136,11 @@ def annotate(
     context_text :
         A longer span of text that serves as additional context for the text
         being annotated for disambiguation purposes.
+    n_jobs :
+        The number of processes to use for annotating sentences in parallel.
+        The default is 1, meaning that sentences are annotated sequentially.
+        If -1, one process is used per CPU. Other values smaller than 1 raise
+        a ValueError.
 
     Returns
     -------
@@ -153,6 +159,7 @@ def annotate(
         organisms=organisms,
         namespaces=namespaces,
         context_text=context_text,
+        n_jobs=n_jobs,
     )
 
 
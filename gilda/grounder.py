@@ -73,6 +73,8 @@ class Grounder(object):
     """
 
     entries: Mapping[str, List[Term]]
+    prefix_index: Mapping[str, Set[int]]
+    prefix_index_sorted: Mapping[str, Tuple[int, ...]]
     namespace_priority: List[str]
 
     def __init__(
@@ -108,10 +110,13 @@ class Grounder(object):
                             'nor a normalized entry name to term dictionary')
 
         self.prefix_index = {}
+        self.prefix_index_sorted = {}
         self._build_prefix_index()
 
         self.adeft_disambiguators = find_adeft_models()
         self.gilda_disambiguators = None
+        # Disambiguation results for the most recently used context
+        self.clear_context_cache()
 
         self.namespace_priority = (
             DEFAULT_NAMESPACE_PRIORITY
@@ -129,6 +134,17 @@ class Grounder(object):
                 continue
             prefix_index[parts[0]].add(len(parts))
         self.prefix_index = dict(prefix_index)
+        # We also store span lengths in decreasing order so that the longest
+        # possible spans can be tried first without sorting at lookup time.
+        # Most prefixes have one of only a few distinct combinations of span
+        # lengths so we share a single tuple object for each combination
+        # to keep the index compact.
+        unique_spans = {}
+        self.prefix_index_sorted = {}
+        for prefix, spans in prefix_index.items():
+            spans = tuple(sorted(spans, reverse=True))
+            self.prefix_index_sorted[prefix] = \
+                unique_spans.setdefault(spans, spans)
 
     def lookup(self, raw_str: str) -> List[Term]:
         """Return matching Terms for a given raw string.
@@ -175,8 +191,11 @@ class Grounder(object):
         for singular, rule in depluralize(raw_str):
             lookups.add(normalize(singular))
 
-        logger.debug('Looking up the following strings: %s' %
-                     ', '.join(lookups))
+        # This is called for every candidate span during annotation so we
+        # avoid building the log message unless it is actually needed
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Looking up the following strings: %s',
+                         ', '.join(lookups))
         return lookups
 
     def _score_namespace(self, term) -> int:
@@ -280,10 +299,14 @@ class Grounder(object):
         raw_str = raw_str.strip()
         # Initial lookup of all possible matches
         entries = self.lookup(raw_str)
-        logger.debug('Filtering %d entries by organism' % len(entries))
+        # Most strings that are grounded during annotation don't match
+        # anything so we return early in this case
+        if not entries:
+            return []
+        logger.debug('Filtering %d entries by organism', len(entries))
         entries = filter_for_organism(entries, organisms)
-        logger.debug('Comparing %s with %d entries' %
-                     (raw_str, len(entries)))
+        logger.debug('Comparing %s with %d entries',
+                     raw_str, len(entries))
         # For each entry to compare to, we generate a match data structure
         # describing the comparison of the raw (unnormalized) input string
         # and the entity text corresponding to the matched Term. This match
@@ -346,14 +369,40 @@ class Grounder(object):
 
         return scored_matches
 
+    def _get_context_cache(self, context):
+        # Disambiguation results only depend on the entity text and the
+        # context, and the same context is typically used for many calls
+        # (e.g., for all entities in a text and its parts being annotated),
+        # so we keep the results for the most recently used context. The
+        # context is compared by identity first since typically the very
+        # same string is passed for every call, and only then by value. The
+        # context and its results are swapped together so that concurrent
+        # calls with different contexts can't mix up results. Only a
+        # single context is kept, and it can be released with
+        # clear_context_cache.
+        cached_context, context_cache = self._context_cache
+        if cached_context is not context and cached_context != context:
+            context_cache = {}
+            self._context_cache = (context, context_cache)
+        return context_cache
+
+    def clear_context_cache(self):
+        """Clear the disambiguation results cached for the last context."""
+        self._context_cache = (None, {})
+
     def disambiguate_adeft(self, raw_str, scored_matches, context):
-        # We find the disambiguator for the given string and pass in
-        # context
-        if self.adeft_disambiguators[raw_str] is None:
-            self.adeft_disambiguators[raw_str] = load_disambiguator(raw_str)
-        res = self.adeft_disambiguators[raw_str].disambiguate([context])
-        # The actual grounding dict is at this index in the result
-        grounding_dict = res[0][2]
+        context_cache = self._get_context_cache(context)
+        grounding_dict = context_cache.get(('adeft', raw_str))
+        if grounding_dict is None:
+            # We find the disambiguator for the given string and pass in
+            # context
+            if self.adeft_disambiguators[raw_str] is None:
+                self.adeft_disambiguators[raw_str] = \
+                    load_disambiguator(raw_str)
+            res = self.adeft_disambiguators[raw_str].disambiguate([context])
+            # The actual grounding dict is at this index in the result
+            grounding_dict = res[0][2]
+            context_cache[('adeft', raw_str)] = grounding_dict
         logger.debug('Result from Adeft: %s' % str(grounding_dict))
         # We attempt to get the score for the 'ungrounded' entry
         ungrounded_score = grounding_dict.get('ungrounded', 1.0)
@@ -385,10 +434,14 @@ class Grounder(object):
         return scored_matches
 
     def disambiguate_gilda(self, raw_str, scored_matches, context):
-        res = self.gilda_disambiguators[raw_str].predict_proba([context])
-        if not res:
-            raise ValueError('No result from disambiguation.')
-        grounding_dict = res[0]
+        context_cache = self._get_context_cache(context)
+        grounding_dict = context_cache.get(('gilda', raw_str))
+        if grounding_dict is None:
+            res = self.gilda_disambiguators[raw_str].predict_proba([context])
+            if not res:
+                raise ValueError('No result from disambiguation.')
+            grounding_dict = res[0]
+            context_cache[('gilda', raw_str)] = grounding_dict
         for match in scored_matches:
             key = '%s:%s' % (match.term.db, match.term.id)
             score_entry = grounding_dict.get(key, None)
@@ -667,6 +720,8 @@ class Annotation:
     end : int
         The end character offset of the text span.
     """
+    __slots__ = ('text', 'matches', 'start', 'end')
+
     def __init__(self, text: str, matches: List[ScoredMatch], start: int,
                  end: int):
         self.text = text
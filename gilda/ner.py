@@ -44,13 +44,26 @@ Gilda implements a way to output annotation in a format appropriate for the
 For brat to work, you need to store the text in a file with
 the extension ``.txt`` and the annotations in a file with the
 same name but extension ``.ann``.
+
+For large numbers of annotations, the brat lines can also be streamed
+directly into a file with :func:`iter_brat`:
+
+.. code-block:: python
+
+    from gilda.ner import iter_brat
+
+    with open("results.ann", "w") as fh:
+        fh.writelines(iter_brat(results))
 """
 
-from typing import List, Set
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterator, List, Set
+import io
 import os
+import re
 
-from nltk.corpus import stopwords
-from nltk.tokenize import PunktSentenceTokenizer, TreebankWordTokenizer
+from nltk.tokenize import PunktSentenceTokenizer
 
 from gilda import get_grounder
 from gilda.grounder import Annotation
@@ -59,6 +72,7 @@ from gilda.process import normalize
 __all__ = [
     "annotate",
     "get_brat",
+    "iter_brat",
     "stop_words"
 ]
 
@@ -74,8 +88,70 @@ def _load_stoplist() -> Set[str]:
     return stoplist
 
 
-stop_words = set(stopwords.words('english'))
-stop_words.update(_load_stoplist())
+#: English stop words, corresponding to the NLTK stopwords corpus
+_ENGLISH_STOP_WORDS = frozenset({
+    'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you',
+    "you're", "you've", "you'll", "you'd", 'your', 'yours', 'yourself',
+    'yourselves', 'he', 'him', 'his', 'himself', 'she', "she's", 'her', 'hers',
+    'herself', 'it', "it's", 'its', 'itself', 'they', 'them', 'their',
+    'theirs', 'themselves', 'what', 'which', 'who', 'whom', 'this', 'that',
+    "that'll", 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'having', 'do', 'does', 'did',
+    'doing', 'a', 'an', 'the', 'and', 'but', 'if', 'or', 'because', 'as',
+    'until', 'while', 'of', 'at', 'by', 'for', 'with', 'about', 'against',
+    'between', 'into', 'through', 'during', 'before', 'after', 'above',
+    'below', 'to', 'from', 'up', 'down', 'in', 'out', 'on', 'off', 'over',
+    'under', 'again', 'further', 'then', 'once', 'here', 'there', 'when',
+    'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few', 'more', 'most',
+    'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so',
+    'than', 'too', 'very', 's', 't', 'can', 'will', 'just', 'don', "don't",
+    'should', "should've", 'now', 'd', 'll', 'm', 'o', 're', 've', 'y', 'ain',
+    'aren', "aren't", 'couldn', "couldn't", 'didn', "didn't", 'doesn',
+    "doesn't", 'hadn', "hadn't", 'hasn', "hasn't", 'haven', "haven't", 'isn',
+    "isn't", 'ma', 'mightn', "mightn't", 'mustn', "mustn't", 'needn',
+    "needn't", 'shan', "shan't", 'shouldn', "shouldn't", 'wasn', "wasn't",
+    'weren', "weren't", 'won', "won't", 'wouldn', "wouldn't"
+})
+
+stop_words = _ENGLISH_STOP_WORDS | _load_stoplist()
+
+#: Characters that are always split off as separate tokens
+_PUNCT = r'()\[\]{}<>;@#$%&?!"'
+
+#: A regular expression matching clitics (as in "BRAF's" or "isn't") and
+#: trailing single quotes at the end of a word, which NLTK's
+#: TreebankWordTokenizer splits off as separate tokens
+_CLITIC = r"(?:(?i:'(?:s|m|d|ll|re|ve)|n't)|')(?![^\s%(p)s.,:])" % \
+    {'p': _PUNCT}
+
+#: A regular expression matching a period at the end of a sentence that is
+#: only followed by closing brackets and quotes, as in "(with TNF.)", which
+#: NLTK's TreebankWordTokenizer splits off as a separate token
+_FINAL_PERIOD = r"(?<=[^.])\.(?=[\])}>\"']*\s*$)"
+
+#: A regular expression that tokenizes text into words and punctuation
+#: the same way as NLTK's TreebankWordTokenizer in most cases: brackets and
+#: similar symbols are split off, commas and colons are split off unless
+#: followed by a digit, ellipses are split off, clitics and trailing single
+#: quotes are split off, a sentence-final period followed by closing
+#: brackets or quotes is split off, and otherwise, periods, dashes and
+#: apostrophes are kept as part of words. Treebank's special handling of
+#: double quotes, double dashes and words like "cannot" is not reproduced.
+_WORD_RE = re.compile(
+    r'\.\.\.|[%(p)s]|[,:](?!\d)|%(c)s|%(f)s'
+    r'|(?:(?!%(c)s|%(f)s)(?:[^\s%(p)s.,:]|\.(?!\.\.)|[,:](?=\d)))+'
+    % {'p': _PUNCT, 'c': _CLITIC, 'f': _FINAL_PERIOD}
+)
+
+#: A regular expression matching a token that is a clitic
+_CLITIC_RE = re.compile(_CLITIC)
+
+#: A regular expression matching any whitespace character
+_SPACE_RE = re.compile(r'\s')
+
+#: A cached version of normalize since the same words tend to recur
+#: both within and across texts being annotated
+_normalize_cached = lru_cache(maxsize=1 << 18)(normalize)
 
 
 def annotate(
@@ -85,6 +161,7 @@ def annotate(
     organisms=None,
     namespaces=None,
     context_text: str = None,
+    n_jobs: int = 1,
 ) -> List[Annotation]:
     """Annotate a given text with Gilda.
 
@@ -109,14 +186,30 @@ def annotate(
     context_text :
         A longer span of text that serves as additional context for the text
         being annotated for disambiguation purposes.
+    n_jobs :
+        The number of processes to use for annotating sentences in parallel.
+        The default is 1, meaning that sentences are annotated sequentially
+        in the current process. If -1, one process is used per CPU. Other
+        values smaller than 1 raise a ValueError. Using multiple processes
+        is only worthwhile for long texts with many sentences. On platforms
+        where processes are started by forking, the grounder is shared with
+        the worker processes, otherwise, it is pickled and sent to each of
+        them.
 
     Returns
     -------
     List[Annotation]
         A list of Annotations where each contains as attributes
         the text span that was matched, the list of ScoredMatches, and the
-        start and end character offsets of the text span.
+        start and end character offsets of the text span. Annotations of
+        the same text span each have their own list of ScoredMatches, but
+        the ScoredMatch objects in these lists are shared.
     """
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    elif n_jobs < 1:
+        raise ValueError('n_jobs must be a positive integer or -1, got %s'
+                         % n_jobs)
     if grounder is None:
         grounder = get_grounder()
     if sent_split_fun is None:
@@ -124,66 +217,151 @@ def annotate(
         sent_split_fun = sent_tokenizer.span_tokenize
     # Get sentences
     sentence_coords = sent_split_fun(text)
-    text_coord = 0
+    context = text if context_text is None else context_text
+    if n_jobs > 1:
+        return _annotate_parallel(text, sentence_coords, grounder, context,
+                                  organisms, namespaces, n_jobs)
     annotations = []
-    word_tokenizer = TreebankWordTokenizer()
-    # FIXME: a custom sentence split function can be inconsistent
-    # with the coordinates being used here which come from NLTK
+    # Since the context, organisms and namespaces are the same for every
+    # span in the text, we can reuse grounding results for recurring spans
+    ground_cache = {}
     for sent_start, sent_end in sentence_coords:
-        sentence = text[sent_start:sent_end]
-        # FIXME: one rare corner case is named entities with single quotes
-        # in them which get tokenized in a weird way
-        raw_word_coords = \
-            list(word_tokenizer.span_tokenize(sentence.rstrip('.')))
-        raw_words = [sentence[start:end] for start, end in raw_word_coords]
-        text_coord += len(sentence) + 1
-        words = [normalize(w) for w in raw_words]
-        skip_until = 0
-        for idx, word in enumerate(words):
-            if idx < skip_until:
-                continue
-            if word in stop_words:
-                continue
-            spans = grounder.prefix_index.get(word, set())
-            if not spans:
+        _annotate_sentence(text, sent_start, sent_end, grounder, context,
+                           organisms, namespaces, ground_cache, annotations)
+    return annotations
+
+
+def _annotate_sentence(text, sent_start, sent_end, grounder, context,
+                       organisms, namespaces, ground_cache, annotations):
+    """Add annotations for a sentence given by its coordinates in a text.
+
+    Annotations are appended directly to the given list, which avoids
+    creating and copying an intermediate list for each sentence.
+    """
+    prefix_index = grounder.prefix_index_sorted
+    # We ignore trailing periods at the end of the sentence
+    while sent_end > sent_start and text[sent_end - 1] == '.':
+        sent_end -= 1
+    # We tokenize the sentence in place, the coordinates of each word with
+    # respect to the full text are only looked up from the regex matches
+    # when a candidate span is found
+    tokens = list(_WORD_RE.finditer(text, sent_start, sent_end))
+    raw_words = [token.group() for token in tokens]
+    words = list(map(_normalize_cached, raw_words))
+    n_words = len(words)
+    skip_until = 0
+    for idx, word in enumerate(words):
+        if idx < skip_until:
+            continue
+        # We look for spans starting with the word itself, and in case the
+        # word is directly followed by a clitic, e.g., "Crohn's", we fall
+        # back to looking for spans starting with the word and the clitic
+        # put back together. The second element of each candidate is the
+        # number of extra tokens it covers.
+        candidates = [(word, 0)]
+        if idx + 1 < n_words and \
+                tokens[idx].end() == tokens[idx + 1].start() and \
+                _CLITIC_RE.fullmatch(raw_words[idx + 1]):
+            candidates.append(
+                (_normalize_cached(raw_words[idx] + raw_words[idx + 1]), 1))
+        for prefix, extra_tokens in candidates:
+            spans = prefix_index.get(prefix)
+            if not spans or prefix in stop_words:
                 continue
+            span = _annotate_span(text, tokens, idx, spans, extra_tokens,
+                                  grounder, context, organisms, namespaces,
+                                  ground_cache, annotations)
+            if span:
+                skip_until = idx + span
+                break
+
+
+def _annotate_span(text, tokens, idx, spans, extra_tokens, grounder, context,
+                   organisms, namespaces, ground_cache, annotations):
+    """Annotate the longest matching span starting at a given token.
+
+    Returns the number of tokens in the annotated span, or 0 if no span
+    was matched.
+    """
+    # Find the largest matching span, spans are sorted in
+    # decreasing order of length
+    for span in spans:
+        span += extra_tokens
+        # Only consider spans that are within the sentence
+        if idx + span > len(tokens):
+            continue
+        start_coord = tokens[idx].start()
+        end_coord = tokens[idx + span - 1].end()
+        # We take the text span, with any whitespace between words
+        # replaced by plain spaces
+        raw_span = text[start_coord:end_coord]
+        if span > 1:
+            raw_span = _SPACE_RE.sub(' ', raw_span)
+        # If span is a single character, we don't want to consider it
+        if len(raw_span) <= 1:
+            continue
+        matches = ground_cache.get(raw_span)
+        if matches is None:
+            matches = grounder.ground(raw_span,
+                                      context=context,
+                                      organisms=organisms,
+                                      namespaces=namespaces)
+            ground_cache[raw_span] = matches
+        if matches:
+            # Each annotation gets its own copy of the list of cached matches
+            # so that changing it doesn't affect other annotations
+            annotations.append(Annotation(
+                raw_span, list(matches), start_coord, end_coord
+            ))
+            return span
+    return 0
+
+
+#: The state of a worker process used for annotating sentences in parallel
+_worker_state = {}
+
+
+def _init_worker(grounder, context, organisms, namespaces):
+    _worker_state.update(grounder=grounder, context=context,
+                         organisms=organisms, namespaces=namespaces,
+                         ground_cache={})
 
-            # Only consider spans that are within the sentence
-            applicable_spans = {span for span in spans
-                                if idx + span <= len(words)}
-
-            # Find the largest matching span
-            for span in sorted(applicable_spans, reverse=True):
-                # We have to reconstruct a text span while adding spaces
-                # where needed
-                raw_span = ''
-                for rw, c in zip(raw_words[idx:idx+span],
-                                    raw_word_coords[idx:idx+span]):
-                    # Figure out if we need a space before this word, then
-                    # append the word.
-                    spaces = ' ' * (c[0] - len(raw_span) -
-                                    raw_word_coords[idx][0])
-                    raw_span += spaces + rw
-                # If span is a single character, we don't want to consider it
-                if len(raw_span) <= 1:
-                    continue
-                context = text if context_text is None else context_text
-                matches = grounder.ground(raw_span,
-                                          context=context,
-                                          organisms=organisms,
-                                          namespaces=namespaces)
-                if matches:
-                    start_coord = sent_start + raw_word_coords[idx][0]
-                    end_coord = sent_start + raw_word_coords[idx+span-1][1]
-                    annotations.append(Annotation(
-                        raw_span, matches, start_coord, end_coord
-                    ))
-
-                    skip_until = idx + span
-                    break
+
+def _annotate_sentence_worker(sentence_offset):
+    sentence, offset = sentence_offset
+    annotations = []
+    _annotate_sentence(sentence, 0, len(sentence),
+                       _worker_state['grounder'],
+                       _worker_state['context'],
+                       _worker_state['organisms'],
+                       _worker_state['namespaces'],
+                       _worker_state['ground_cache'],
+                       annotations)
+    # Coordinates are relative to the sentence so we shift them to be
+    # relative to the full text
+    for annotation in annotations:
+        annotation.start += offset
+        annotation.end += offset
     return annotations
 
 
+def _annotate_parallel(text, sentence_coords, grounder, context, organisms,
+                       namespaces, n_jobs):
+    """Annotate sentences of a text in parallel using a process pool."""
+    # Only the sentences themselves are sent to the workers, the grounder
+    # and the context are passed once when each worker is initialized
+    tasks = [(text[sent_start:sent_end], sent_start)
+             for sent_start, sent_end in sentence_coords]
+    chunksize = max(1, len(tasks) // (4 * n_jobs))
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                             initargs=(grounder, context, organisms,
+                                       namespaces)) as executor:
+        results = executor.map(_annotate_sentence_worker, tasks,
+                               chunksize=chunksize)
+        return [annotation for annotations in results
+                for annotation in annotations]
+
+
 def get_brat(annotations, entity_type="Entity", ix_offset=1, include_text=True):
     """Return brat-formatted annotation strings for the given entities.
 
@@ -207,16 +385,32 @@ def get_brat(annotations, entity_type="Entity", ix_offset=1, include_text=True):
     str
         A string containing the brat-formatted annotations.
     """
-    brat = []
+    buf = io.StringIO()
+    for line in iter_brat(annotations, entity_type=entity_type,
+                          ix_offset=ix_offset, include_text=include_text):
+        buf.write(line)
+    # For consistency with a single newline separating annotations, an empty
+    # list of annotations results in a single newline
+    return buf.getvalue() or '\n'
+
+
+def iter_brat(annotations, entity_type="Entity", ix_offset=1,
+              include_text=True) -> Iterator[str]:
+    """Yield brat-formatted annotation lines for the given entities.
+
+    This is useful for streaming annotations directly into a ``.ann`` file,
+    e.g., with ``fh.writelines(iter_brat(annotations))``. Each line ends with
+    a newline. See :func:`get_brat` for a description of the parameters.
+    """
     ix_offset = max(1, ix_offset)
     for idx, annotation in enumerate(annotations, ix_offset):
         curie = annotation.matches[0].term.get_curie()
         if entity_type != "Entity":
             curie += f"; Reading system: {entity_type}"
-        row = f'T{idx}\t{entity_type} {annotation.start} {annotation.end}' + (
-            f'\t{annotation.text}' if include_text else ''
-        )
-        brat.append(row)
-        row = f'#{idx}\tAnnotatorNotes T{idx}\t{curie}'
-        brat.append(row)
-    return '\n'.join(brat) + '\n'
+        if include_text:
+            yield (f'T{idx}\t{entity_type} {annotation.start} '
+                   f'{annotation.end}\t{annotation.text}\n')
+        else:
+            yield (f'T{idx}\t{entity_type} {annotation.start} '
+                   f'{annotation.end}\n')
+        yield f'#{idx}\tAnnotatorNotes T{idx}\t{curie}\n'
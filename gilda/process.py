@@ -27,6 +27,10 @@ def replace_dashes(s, rep='-'):
     str
         The string in which dashes have been replaced.
     """
+    # The plain ASCII dash is the only kind of dash in ASCII strings, which
+    # most strings are, so we can avoid scanning for each kind of dash
+    if s.isascii():
+        return s.replace('-', rep) if rep != '-' else s
     for d in dashes:
         s = s.replace(d, rep)
     return s
@@ -138,6 +142,14 @@ def replace_unicode(s):
                    for c in s)
 
 
+# A regular expression matching words whose capitalization pattern is not
+# mixed. The groups capture an initial upper case letter, followed by
+# either only upper case letters or only lower case letters, or
+# alternatively, a word consisting of only lower case letters.
+_capitalization_pattern_regex = \
+    re.compile(r'^(?:(\p{Lu})(?:(\p{Lu}+)|(\p{Ll}+))?|(\p{Ll}+))$')
+
+
 def get_capitalization_pattern(word, beginning_of_sentence=False):
     """Return the type of capitalization for the string.
 
@@ -156,18 +168,22 @@ def get_capitalization_pattern(word, beginning_of_sentence=False):
         initial_cap, mixed.
 
     """
-    if beginning_of_sentence and re.match(r'^\p{Lu}\p{Ll}*$', word):
-        return 'sentence_initial_cap'
-    elif re.match(r'^\p{Lu}$', word):
-        return 'single_cap_letter'
-    elif re.match(r'^\p{Lu}+$', word):
-        return 'all_caps'
-    elif re.match(r'^\p{Ll}+$', word):
+    # We determine the pattern with a single match, see the groups of
+    # _capitalization_pattern_regex for the cases that are distinguished
+    match = _capitalization_pattern_regex.match(word)
+    if match is None:
+        return 'mixed'
+    initial_upper, rest_upper, rest_lower, all_lower = match.groups()
+    if all_lower:
         return 'all_lower'
-    elif re.match(r'^\p{Lu}\p{Ll}+$', word):
+    elif rest_upper:
+        return 'all_caps'
+    elif beginning_of_sentence:
+        return 'sentence_initial_cap'
+    elif rest_lower:
         return 'initial_cap'
     else:
-        return 'mixed'
+        return 'single_cap_letter'
 
 
 def depluralize(word: str) -> List[Tuple[str, str]]:
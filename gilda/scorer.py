@@ -1,3 +1,4 @@
+import re
 from copy import deepcopy
 from .process import replace_dashes, replace_whitespace, normalize, \
     get_capitalization_pattern
@@ -11,8 +12,28 @@ __all__ = [
 ]
 
 
+#: A regular expression for splitting strings into pieces at spaces and dashes
+#: while keeping the separators
+_SEPARATOR_RE = re.compile(r'([ -])')
+
+#: Classes of characters relevant for aligning strings, any other character
+#: has class 0
+_CHAR_CLASSES = {' ': 1, '-': 2}
+
+# Constant sets of capitalization patterns and combinations used in scoring
+_ACIC_EXACT_COMBOS = frozenset({('sentence_initial', 'all_lower')})
+_ACIC_PARTIAL_COMBOS = frozenset({('all_caps', 'sentence_initial_cap'),
+                                  ('sentence_initial_cap', 'all_caps')})
+_COMBO_QUERY_CASES = frozenset({'single_cap_letter', 'initial_cap',
+                                'all_lower'})
+
+
 class Match(object):
     """Class representing a match between a query and a reference string"""
+    __slots__ = ('query', 'ref', 'exact', 'space_mismatch', 'dash_mismatches',
+                 'cap_combos', '_cap_combo_set', '_query_case_set',
+                 '_ref_case_set')
+
     def __init__(self, query, ref, exact=None, space_mismatch=None,
                  dash_mismatches=None, cap_combos=None):
         self.query = query
@@ -23,10 +44,17 @@ class Match(object):
         self.dash_mismatches = dash_mismatches if dash_mismatches is not None \
             else {}
         self.cap_combos = cap_combos if cap_combos is not None else []
+        # The capitalization combinations are looked at repeatedly during
+        # scoring so we precompute the sets derived from them here
+        self._cap_combo_set = frozenset(self.cap_combos)
+        self._query_case_set = frozenset(c[0] for c in self.cap_combos)
+        self._ref_case_set = frozenset(c[1] for c in self.cap_combos)
 
     def __str__(self):
-        return 'Match(%s)' % (','.join(['%s=%s' % (k, v) for k, v in
-                                        self.__dict__.items()]))
+        attrs = ['query', 'ref', 'exact', 'space_mismatch', 'dash_mismatches',
+                 'cap_combos']
+        return 'Match(%s)' % (','.join(['%s=%s' % (k, getattr(self, k))
+                                        for k in attrs]))
 
     def __repr__(self):
         return str(self)
@@ -42,24 +70,24 @@ class Match(object):
         }
 
     def _query_cases(self):
-        return {c[0] for c in self.cap_combos}
+        return self._query_case_set
 
     def _ref_cases(self):
-        return {c[1] for c in self.cap_combos}
+        return self._ref_case_set
 
     def score_short_abbr(self):
         if len(self.ref) <= 3 and \
-                (('all_caps', 'all_lower') in self.cap_combos or
-                 ('all_lower', 'all_caps') in self.cap_combos):
+                (('all_caps', 'all_lower') in self._cap_combo_set or
+                 ('all_lower', 'all_caps') in self._cap_combo_set):
             return 0
         else:
             return 1
 
     def score_mixed(self):
-        if ('mixed', 'mixed') in self.cap_combos:
+        if ('mixed', 'mixed') in self._cap_combo_set:
             return 0
-        elif ('mixed' in self._query_cases()) or \
-                ('mixed' in self._ref_cases()):
+        elif ('mixed' in self._query_case_set) or \
+                ('mixed' in self._ref_case_set):
             return 1
         else:
             return 2
@@ -70,18 +98,17 @@ class Match(object):
     def score_acic(self):
         if self.exact is True and not self.cap_combos:
             return 2
-        elif set(self.cap_combos) == {('sentence_initial', 'all_lower')}:
+        elif self._cap_combo_set == _ACIC_EXACT_COMBOS:
             return 2
-        if self.exact is True and set(self.cap_combos) <= \
-                {('all_caps', 'sentence_initial_cap'),
-                 ('sentence_initial_cap', 'all_caps')}:
+        if self.exact is True and \
+                self._cap_combo_set <= _ACIC_PARTIAL_COMBOS:
             return 1
         else:
             return 0
 
     def score_combo(self):
-        qc = self._query_cases()
-        rc = self._ref_cases()
+        qc = self._query_case_set
+        rc = self._ref_case_set
         query_combo = 4 - len(qc)
         ref_combo = 4 - len(rc)
         if 'single_cap_letter' in qc and \
@@ -90,11 +117,9 @@ class Match(object):
         if 'single_cap_letter' in rc and \
                 ('all_caps' in rc or 'initial_cap' in rc):
             ref_combo += 1
-        if 'sentence_initial_cap' in qc and \
-                (len(qc) == 1 and
-                 ('sentence_initial_cap', 'all_lower') in self.cap_combos) \
-                or \
-                 {'single_cap_letter', 'initial_cap', 'all_lower'} & qc:
+        if (len(qc) == 1 and 'sentence_initial_cap' in qc and
+                ('sentence_initial_cap', 'all_lower') in self._cap_combo_set) \
+                or not qc.isdisjoint(_COMBO_QUERY_CASES):
             query_combo += 1
         combo = max(query_combo, ref_combo)
         return combo
@@ -132,54 +157,70 @@ def generate_match(query, ref, beginning_of_sentence=False):
     if not beginning_of_sentence and query == ref:
         return Match(query, ref, exact=True)
 
-    query_suffix = query
-    ref_suffix = ref
-    query_pieces = ['']
-    ref_pieces = ['']
-    dash_mismatches = set()
-    while query_suffix and ref_suffix:
-        # Deal with spaces first
-        qs = (query_suffix[0] == ' ')
-        rs = (ref_suffix[0] == ' ')
-        # If both have spaces, we start new pieces and skip the spaces
-        if qs and rs:
-            query_suffix = query_suffix[1:]
-            ref_suffix = ref_suffix[1:]
-            query_pieces.append('')
-            ref_pieces.append('')
-        # This means that there is a space inconsistency which we don't allow
-        # and return immediately
-        elif qs and not rs or rs and not qs:
-            return Match(query, ref, space_mismatch=True)
-
-        # We next deal with dashes
-        qd = (query_suffix[0] == '-')
-        rd = (ref_suffix[0] == '-')
-        # If both are dashes, we skip them
-        if qd and rd:
-            query_suffix = query_suffix[1:]
-            ref_suffix = ref_suffix[1:]
-            query_pieces.append('')
-            ref_pieces.append('')
-        # If there is a mismatch, we introduce new pieces but only skip the one
-        # dash and record the inconsistency
-        elif qd and not rd:
-            dash_mismatches.add('query')
-            query_suffix = query_suffix[1:]
-            query_pieces.append('')
-            ref_pieces.append('')
-        elif not qd and rd:
-            dash_mismatches.add('ref')
-            ref_suffix = ref_suffix[1:]
-            query_pieces.append('')
-            ref_pieces.append('')
-        # Otherwise both strings start with a non space/dash character that we
-        # add to the latest piece
-        else:
-            query_pieces[-1] += query_suffix[0]
-            ref_pieces[-1] += ref_suffix[0]
-            ref_suffix = ref_suffix[1:]
-            query_suffix = query_suffix[1:]
+    # In the common case where the two strings only differ in
+    # capitalization, spaces and dashes are at the same positions in both
+    # so we can get the pieces by simply splitting the strings at them
+    query_parts = _SEPARATOR_RE.split(query)
+    ref_parts = _SEPARATOR_RE.split(ref)
+    if query_parts[1::2] == ref_parts[1::2] and \
+            list(map(len, query_parts)) == list(map(len, ref_parts)):
+        query_pieces = query_parts[::2]
+        ref_pieces = ref_parts[::2]
+        dash_mismatches = set()
+    else:
+        # Otherwise, we walk both strings in parallel using indices, keeping
+        # track of the start of the current piece in each string so that
+        # pieces can be sliced out of the strings once they are completed
+        qi = ri = 0
+        ql = len(query)
+        rl = len(ref)
+        query_start = ref_start = 0
+        query_pieces = []
+        ref_pieces = []
+        dash_mismatches = set()
+        get_char_class = _CHAR_CLASSES.get
+        while qi < ql and ri < rl:
+            # We look at the classes of the current characters together
+            # (see _CHAR_CLASSES), i.e., 0 means that neither is a space or
+            # a dash, 4 that both are spaces, 8 that both are dashes, etc.
+            combo = 3 * get_char_class(query[qi], 0) + \
+                get_char_class(ref[ri], 0)
+            # If both strings have a non space/dash character, it belongs
+            # to the current piece
+            if combo == 0:
+                qi += 1
+                ri += 1
+            # If both have spaces or both have dashes, we start new pieces
+            # and skip them
+            elif combo == 4 or combo == 8:
+                query_pieces.append(query[query_start:qi])
+                ref_pieces.append(ref[ref_start:ri])
+                qi += 1
+                ri += 1
+                query_start = qi
+                ref_start = ri
+            # If there is a dash mismatch, we introduce new pieces but only
+            # skip the one dash and record the inconsistency
+            elif combo == 6:
+                dash_mismatches.add('query')
+                query_pieces.append(query[query_start:qi])
+                ref_pieces.append(ref[ref_start:ri])
+                qi += 1
+                query_start = qi
+                ref_start = ri
+            elif combo == 2:
+                dash_mismatches.add('ref')
+                query_pieces.append(query[query_start:qi])
+                ref_pieces.append(ref[ref_start:ri])
+                ri += 1
+                query_start = qi
+                ref_start = ri
+            # Otherwise only one of the strings has a space which is an
+            # inconsistency we don't allow so we return immediately
+            else:
+                return Match(query, ref, space_mismatch=True)
+        query_pieces.append(query[query_start:qi])
+        ref_pieces.append(ref[ref_start:ri])
 
     # Now that we have the final pieces in place, we can count the matches and
     # capitalization relationships
@@ -219,21 +260,22 @@ def score_string_match(match):
     float
         A match score between 0 and 1.
     """
-    terms = [
-        (match.score_short_abbr, 2),
-        (match.score_mixed, 3),
-        (match.score_exact, 2),
-        (match.score_acic, 3),
-        (match.score_combo, 5),
-        (match.score_dash, 3)
-    ]
-    score = 0
-    norm = 1
-    for fun, coeff in terms:
-        score = coeff * score + fun()
-        norm *= coeff
-    score /= (norm - 1)
-    return score
+    # An exact match without any capitalization or dash differences gets
+    # the maximal score on each term so we can return early
+    if match.exact is True and not match.cap_combos \
+            and not match.dash_mismatches:
+        return 1.0
+    # The individual score terms are combined in decreasing order of
+    # importance with coefficients 2, 3, 2, 3, 5 and 3, respectively, and
+    # the result is normalized by the product of the coefficients minus one,
+    # i.e., 2 * 3 * 2 * 3 * 5 * 3 - 1 = 539.
+    score = match.score_short_abbr()
+    score = 3 * score + match.score_mixed()
+    score = 2 * score + match.score_exact()
+    score = 3 * score + match.score_acic()
+    score = 5 * score + match.score_combo()
+    score = 3 * score + match.score_dash()
+    return score / 539
 
 
 def score_status(term):
@@ -296,3 +296,83 @@ def test_instantiate():
 
     with pytest.raises(TypeError):
         Grounder(5)
+
+
+def test_prefix_index():
+    terms = [
+        Term(norm_text, text, "HGNC", str(idx), text, "synonym", "hgnc")
+        for idx, (norm_text, text) in enumerate([
+            ("tnf", "TNF"),
+            ("tnf alpha receptor", "TNF alpha receptor"),
+            ("tnf alpha", "TNF alpha"),
+            ("tnf receptor", "TNF receptor"),
+            ("egf", "EGF"),
+            ("egf receptor", "EGF receptor"),
+            ("il6", "IL6"),
+            ("il6 receptor", "IL6 receptor"),
+        ])
+    ]
+    gr = Grounder(terms)
+    assert gr.prefix_index == {"tnf": {1, 2, 3}, "egf": {1, 2},
+                               "il6": {1, 2}}
+    assert gr.prefix_index_sorted == {"tnf": (3, 2, 1), "egf": (2, 1),
+                                      "il6": (2, 1)}
+    # Identical span combinations share the same tuple
+    assert gr.prefix_index_sorted["egf"] is gr.prefix_index_sorted["il6"]
+
+
+def test_disambiguation_context_cache():
+    class CountingModel:
+        calls = 0
+
+        def predict_proba(self, contexts):
+            CountingModel.calls += 1
+            return [{"GO:GO:0005783": 0.9, "HGNC:3467": 0.1}]
+
+    terms = [
+        Term("er", "ER", "HGNC", "3467", "ESR1", "synonym", "hgnc", "9606"),
+        Term("er", "ER", "GO", "GO:0005783", "endoplasmic reticulum",
+             "synonym", "go"),
+    ]
+    gr = Grounder(terms)
+    gr.gilda_disambiguators = {"ER": CountingModel()}
+    context = "Calcium is released from the ER."
+    for _ in range(3):
+        matches = gr.ground("ER", context=context)
+        assert matches[0].term.id == "GO:0005783"
+    assert CountingModel.calls == 1
+    # An equal context that is a different string object is a cache hit
+    gr.ground("ER", context=" ".join(context.split(" ")))
+    assert CountingModel.calls == 1
+    gr.ground("ER", context="Another context.")
+    assert CountingModel.calls == 2
+    gr.clear_context_cache()
+    gr.ground("ER", context="Another context.")
+    assert CountingModel.calls == 3
+
+
+def test_disambiguation_context_cache_adeft():
+    class CountingDisambiguator:
+        calls = 0
+
+        def disambiguate(self, contexts):
+            CountingDisambiguator.calls += 1
+            return [("GO:GO:0005783", "endoplasmic reticulum",
+                     {"GO:GO:0005783": 0.9, "HGNC:3467": 0.1})]
+
+    terms = [
+        Term("er", "ER", "HGNC", "3467", "ESR1", "synonym", "hgnc", "9606"),
+        Term("er", "ER", "GO", "GO:0005783", "endoplasmic reticulum",
+             "synonym", "go"),
+    ]
+    gr = Grounder(terms)
+    gr.adeft_disambiguators = {"ER": CountingDisambiguator()}
+    gr.gilda_disambiguators = {}
+    context = "Calcium is released from the ER."
+    for _ in range(3):
+        matches = gr.ground("ER", context=context)
+        assert matches[0].term.id == "GO:0005783"
+        assert matches[0].disambiguation["type"] == "adeft"
+    assert CountingDisambiguator.calls == 1
+    gr.ground("ER", context="Another context.")
+    assert CountingDisambiguator.calls == 2
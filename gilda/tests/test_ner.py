@@ -1,7 +1,9 @@
 from textwrap import dedent
 
+import pytest
+
 import gilda
-from gilda.ner import get_brat
+from gilda.ner import get_brat, iter_brat
 
 
 def test_annotate():
@@ -47,6 +49,7 @@ def test_get_brat():
         #4\tAnnotatorNotes T4\thgnc:1097
         """).lstrip()
     assert brat_str == match_str
+    assert ''.join(iter_brat(gilda.annotate(full_text))) == match_str
 
 
 def test_get_all():
@@ -102,3 +105,56 @@ def test_punctuation_outside_entities():
     assert len(res) == 3
 
     assert [ann.text for ann in res] == ['EGF', 'EGFR', 'receptor']
+
+
+def test_final_period_before_closing_punctuation():
+    res = gilda.annotate('Cells were treated (with BRAF.)')
+    assert ('BRAF', 25, 29) in [(ann.text, ann.start, ann.end) for ann in res]
+
+    res = gilda.annotate('We used BRAF." Then EGF was added.')
+    assert ('BRAF', 8, 12) in [(ann.text, ann.start, ann.end) for ann in res]
+
+
+def test_apostrophe_in_entity():
+    res = gilda.annotate("Crohn's disease is an inflammatory disease.")
+    assert res[0].text == "Crohn's disease"
+    assert (res[0].start, res[0].end) == (0, 15)
+    assert res[0].matches[0].term.get_curie() == "mesh:D003424"
+
+
+def test_clitic_outside_entity():
+    res = gilda.annotate("BRAF's activity")
+    assert res[0].text == "BRAF"
+    assert (res[0].start, res[0].end) == (0, 4)
+    assert res[0].matches[0].term.get_curie() == "hgnc:1097"
+
+
+def test_repeated_entity_matches_not_shared():
+    res = gilda.annotate("BRAF is a gene. BRAF is a protein.")
+    assert [ann.text for ann in res] == ['BRAF', 'BRAF']
+    expected_matches = list(res[1].matches)
+    res[0].matches.clear()
+    assert res[1].matches == expected_matches
+    assert res[1].matches[0].term.get_curie() == "hgnc:1097"
+
+
+def test_annotate_parallel():
+    full_text = \
+        "The protein BRAF is a kinase.\nBRAF is a gene.\nBRAF is a protein."
+    annotations = gilda.annotate(full_text)
+    parallel_annotations = gilda.annotate(full_text, n_jobs=2)
+    assert [(a.text, a.start, a.end, a.matches[0].term.get_curie())
+            for a in annotations] == \
+        [(a.text, a.start, a.end, a.matches[0].term.get_curie())
+         for a in parallel_annotations]
+
+
+def test_annotate_n_jobs():
+    full_text = "BRAF is a gene. BRAF is a protein."
+    annotations = gilda.annotate(full_text)
+    all_cpu_annotations = gilda.annotate(full_text, n_jobs=-1)
+    assert [(a.text, a.start, a.end) for a in annotations] == \
+        [(a.text, a.start, a.end) for a in all_cpu_annotations]
+    for n_jobs in (0, -2):
+        with pytest.raises(ValueError):
+            gilda.annotate(full_text, n_jobs=n_jobs)
@@ -44,3 +44,9 @@ def test_string_match_scoring():
         score = score_string_match(match)
         assert appreq(score, expected_score), (score, expected_score)
 
+
+def test_generate_match_trailing_space():
+    match = generate_match('braf ', 'BRAF ')
+    assert not match.space_mismatch
+    assert ('all_lower', 'all_caps') in match.cap_combos, match
+    assert appreq(score_string_match(match), 0.9443), match